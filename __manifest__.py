@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 {
     'name': 'GearGuard - Maintenance Tracker',
-    'version': '17.0.1.0.0',
+    'version': '17.0.1.1.0',
     'category': 'Maintenance',
     'summary': 'Ultimate Equipment Maintenance Management System',
     'description': """
@@ -44,6 +44,7 @@ Key Features:
         'views/team_views.xml',
         'views/equipment_views.xml',
         'views/request_views.xml',
+        'views/report_views.xml',
         'views/menu_views.xml',
         # Data
         'data/mail_templates.xml',
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Pre-migration to 17.0.1.1.0
+===========================
+
+Runs before the module's models are loaded on upgrade.
+"""
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    # The equipment photo field was renamed from `image` (Binary) to
+    # `image_1920` (Image); keep the existing attachments linked to it.
+    # The image_128/image_512 thumbnails are recomputed from image_1920.
+    cr.execute("""
+        UPDATE ir_attachment
+           SET res_field = 'image_1920'
+         WHERE res_model = 'maintenance.equipment'
+           AND res_field = 'image'
+    """)
+
+    # Serial uniqueness is enforced by the serial_unique EXCLUDE constraint
+    # again; the interim partial unique index would fire first with a raw
+    # IntegrityError instead of the constraint's message.
+    cr.execute("DROP INDEX IF EXISTS maintenance_equipment_serial_active_uniq")
+
+    # Partial indexes without a consumer
+    cr.execute("DROP INDEX IF EXISTS maintenance_request_team_new_idx")
+    cr.execute("DROP INDEX IF EXISTS maintenance_request_equipment_stage_idx")
+
+    # Recreated by maintenance.request init() with an IN predicate that the
+    # overdue domain can match
+    cr.execute("DROP INDEX IF EXISTS maintenance_request_overdue_idx")
+
+    # resolution_days is computed by the report views again, not stored
+    cr.execute("DROP INDEX IF EXISTS maintenance_request_resolution_days_closed_idx")
@@ -28,7 +28,7 @@ FIELDS TO IMPLEMENT:
 | name                    | Char      | YES      | Equipment name                           |
 | serial_number           | Char      | NO       | Unique serial/asset number               |
 | active                  | Boolean   | NO       | Archive flag (False when scrapped)       |
-| image                   | Binary    | NO       | Equipment photo                          |
+| image_1920              | Image     | NO       | Equipment photo (+ 128/512 thumbnails)   |
 | category_id             | Many2one  | NO       | Equipment category                       |
 | owner_type              | Selection | NO       | 'department' or 'employee'               |
 | department_id           | Many2one  | NO       | Owning department (if owner_type=dept)   |
@@ -59,7 +59,7 @@ METHODS TO IMPLEMENT:
 2. _compute_warranty_alert() - Check warranty expiration
 3. _compute_maintenance_stats() - Calculate cost, downtime, MTBF
 4. action_view_requests() - Smart button action
-5. _onchange_owner_type() - Clear department/employee based on selection
+5. _compute_department_id/_compute_employee_id() - Clear owner based on selection
 6. _onchange_maintenance_team_id() - Filter technician to team members
 
 SMART BUTTON (Critical Feature):
@@ -88,16 +88,29 @@ DEMO DATA NEEDED:
 - Old Machine #006 (to be scrapped in demo)
 """
 
+import operator as py_operator
 from datetime import timedelta
 from odoo import models, fields, api, _
-from odoo.exceptions import ValidationError
+from odoo.exceptions import UserError, ValidationError
+from odoo.osv import expression
+
+# Comparison operators supported when searching days_to_warranty_end
+DAYS_OPERATORS = {
+    '=': py_operator.eq,
+    '!=': py_operator.ne,
+    '<': py_operator.lt,
+    '<=': py_operator.le,
+    '>': py_operator.gt,
+    '>=': py_operator.ge,
+}
 
 
 class MaintenanceEquipment(models.Model):
     _name = 'maintenance.equipment'
     _description = 'Maintenance Equipment'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread']
     _order = 'name'
+    _rec_names_search = ['name', 'serial_number']
 
     # ==========================================================================
     # BASIC FIELDS
@@ -106,31 +119,47 @@ class MaintenanceEquipment(models.Model):
     name = fields.Char(
         string='Equipment Name',
         required=True,
-        tracking=True,
         help="Name or title of the equipment (e.g., 'CNC Machine #001')"
     )
 
     serial_number = fields.Char(
         string='Serial Number',
         copy=False,
-        tracking=True,
         help="Unique serial number or asset tag for this equipment"
     )
 
     active = fields.Boolean(
         string='Active',
         default=True,
-        tracking=True,
+        tracking=10,
         help="If unchecked, the equipment is considered scrapped/retired. "
              "This is automatically set to False when a request moves to 'Scrap' stage."
     )
 
-    image = fields.Binary(
+    image_1920 = fields.Image(
         string='Image',
-        attachment=True,
+        max_width=1920,
+        max_height=1920,
         help="Photo or image of the equipment"
     )
 
+    # Resized variants so kanban cards and forms don't download the original
+    image_128 = fields.Image(
+        string='Image 128',
+        related='image_1920',
+        max_width=128,
+        max_height=128,
+        store=True
+    )
+
+    image_512 = fields.Image(
+        string='Image 512',
+        related='image_1920',
+        max_width=512,
+        max_height=512,
+        store=True
+    )
+
     state = fields.Selection(
         selection=[
             ('operational', 'Operational'),
@@ -139,13 +168,12 @@ class MaintenanceEquipment(models.Model):
         ],
         string='Status',
         default='operational',
-        tracking=True,
+        tracking=10,
         help="Current operational status of the equipment"
     )
 
     location = fields.Char(
         string='Location',
-        tracking=True,
         help="Physical location of the equipment (e.g., 'Building A, Floor 2')"
     )
 
@@ -157,7 +185,7 @@ class MaintenanceEquipment(models.Model):
     company_id = fields.Many2one(
         comodel_name='res.company',
         string='Company',
-        default=lambda self: self.env.company,
+        default=lambda self: self.env.company.id,
         help="Company this equipment belongs to"
     )
 
@@ -167,13 +195,13 @@ class MaintenanceEquipment(models.Model):
 
     purchase_date = fields.Date(
         string='Purchase Date',
-        tracking=True,
         help="Date when the equipment was purchased or acquired"
     )
 
     warranty_date = fields.Date(
         string='Warranty Expiration',
-        tracking=True,
+        index=True,
+        tracking=10,
         help="Date when the warranty expires. Used for warranty alerts."
     )
 
@@ -188,21 +216,24 @@ class MaintenanceEquipment(models.Model):
         ],
         string='Owner Type',
         default='department',
-        tracking=True,
         help="Specify whether this equipment belongs to a department or an individual employee"
     )
 
     department_id = fields.Many2one(
         comodel_name='hr.department',
         string='Department',
-        tracking=True,
+        compute='_compute_department_id',
+        store=True,
+        readonly=False,
         help="Department that owns this equipment (when Owner Type = Department)"
     )
 
     employee_id = fields.Many2one(
         comodel_name='hr.employee',
         string='Employee',
-        tracking=True,
+        compute='_compute_employee_id',
+        store=True,
+        readonly=False,
         help="Employee assigned to this equipment (when Owner Type = Employee)"
     )
 
@@ -213,7 +244,7 @@ class MaintenanceEquipment(models.Model):
     category_id = fields.Many2one(
         comodel_name='maintenance.equipment.category',
         string='Category',
-        tracking=True,
+        index=True,
         help="Category of equipment (e.g., Machinery, IT Equipment, Vehicles)"
     )
 
@@ -221,7 +252,7 @@ class MaintenanceEquipment(models.Model):
         comodel_name='maintenance.team',
         string='Maintenance Team',
         required=True,
-        tracking=True,
+        tracking=10,
         help="Default team responsible for maintaining this equipment. "
              "Auto-filled into maintenance requests."
     )
@@ -229,17 +260,15 @@ class MaintenanceEquipment(models.Model):
     technician_id = fields.Many2one(
         comodel_name='res.users',
         string='Technician',
-        tracking=True,
-        domain="[('id', 'in', team_member_ids)]",
+        domain="technician_domain",
         help="Default technician for this equipment. Should be a member of the Maintenance Team."
     )
 
-    # Helper field for technician domain
-    team_member_ids = fields.Many2many(
-        comodel_name='res.users',
-        related='maintenance_team_id.member_ids',
-        string='Team Members',
-        help="Members of the selected maintenance team (for domain filtering)"
+    # Helper field for technician domain, resolved once when the form loads
+    technician_domain = fields.Binary(
+        string='Technician Domain',
+        compute='_compute_technician_domain',
+        help="Domain restricting the technician to members of the maintenance team"
     )
 
     # ==========================================================================
@@ -273,19 +302,22 @@ class MaintenanceEquipment(models.Model):
 
     # ==========================================================================
     # COMPUTED FIELDS - WARRANTY ALERTS
+    # Not stored: their value depends on today's date, so storing them would
+    # require a daily rewrite of every equipment row. Searches are translated
+    # into warranty_date domains and run in SQL.
     # ==========================================================================
 
     warranty_alert = fields.Boolean(
         string='Warranty Alert',
         compute='_compute_warranty_alert',
-        store=True,
+        search='_search_warranty_alert',
         help="True if warranty expires within 30 days"
     )
 
     days_to_warranty_end = fields.Integer(
         string='Days to Warranty End',
         compute='_compute_warranty_alert',
-        store=True,
+        search='_search_days_to_warranty_end',
         help="Number of days until warranty expires (negative if expired)"
     )
 
@@ -298,7 +330,7 @@ class MaintenanceEquipment(models.Model):
         ],
         string='Warranty Status',
         compute='_compute_warranty_alert',
-        store=True,
+        search='_search_warranty_state',
         help="Current warranty status for visual indicators"
     )
 
@@ -342,15 +374,51 @@ class MaintenanceEquipment(models.Model):
     def _compute_request_counts(self):
         """
         Compute total and open request counts for smart button.
-        Uses the One2many relationship directly to avoid N+1 queries.
+        Uses one query grouped by equipment and stage over the whole
+        recordset instead of loading every request into the ORM cache.
+        """
+        total = dict.fromkeys(self.ids, 0)
+        opened = dict.fromkeys(self.ids, 0)
+        for equipment, stage, count in self.env['maintenance.request']._read_group(
+            domain=[('equipment_id', 'in', self.ids)],
+            groupby=['equipment_id', 'stage'],
+            aggregates=['__count']
+        ):
+            total[equipment.id] += count
+            if stage not in ('repaired', 'scrap'):
+                opened[equipment.id] += count
+        for equipment in self:
+            equipment.request_count = total.get(equipment.id, 0)
+            equipment.open_request_count = opened.get(equipment.id, 0)
+
+    @api.depends('maintenance_team_id', 'maintenance_team_id.member_ids')
+    def _compute_technician_domain(self):
+        """
+        Restrict selectable technicians to the members of the maintenance team.
+        """
+        for equipment in self:
+            equipment.technician_domain = [
+                ('id', 'in', equipment.maintenance_team_id.member_ids.ids)
+            ]
+
+    @api.depends('owner_type')
+    def _compute_department_id(self):
+        """
+        Clear the department when the equipment is owned by an employee.
+        Runs server-side, so creates, writes and imports keep the invariant.
         """
         for equipment in self:
-            # Use the One2many relationship instead of search to avoid N+1 queries
-            requests = equipment.request_ids.filtered(lambda r: r.active)
-            equipment.request_count = len(requests)
-            equipment.open_request_count = len(requests.filtered(
-                lambda r: r.stage not in ('repaired', 'scrap')
-            ))
+            if equipment.owner_type == 'employee':
+                equipment.department_id = False
+
+    @api.depends('owner_type')
+    def _compute_employee_id(self):
+        """
+        Clear the employee when the equipment is owned by a department.
+        """
+        for equipment in self:
+            if equipment.owner_type == 'department':
+                equipment.employee_id = False
 
     @api.depends('warranty_date')
     def _compute_warranty_alert(self):
@@ -372,72 +440,131 @@ class MaintenanceEquipment(models.Model):
         - Yellow alert: 8-30 days (warning)
         - Green: > 30 days (ok)
         """
-        today = fields.Date.today()
+        today = self._get_today()
+        threshold = today + timedelta(days=30)
+        # Integer ordinals avoid allocating a timedelta per record
+        today_ordinal = today.toordinal()
         for equipment in self:
-            if not equipment.warranty_date:
+            warranty_date = equipment.warranty_date
+            if not warranty_date:
                 equipment.warranty_alert = False
                 equipment.days_to_warranty_end = 0
                 equipment.warranty_state = 'none'
+                continue
+            if warranty_date <= today:
+                state = 'expired'
+            elif warranty_date <= threshold:
+                state = 'expiring'
             else:
-                delta = (equipment.warranty_date - today).days
-                equipment.days_to_warranty_end = delta
-                equipment.warranty_alert = delta <= 30
-                if delta <= 0:
-                    equipment.warranty_state = 'expired'
-                elif delta <= 30:
-                    equipment.warranty_state = 'expiring'
-                else:
-                    equipment.warranty_state = 'valid'
+                state = 'valid'
+            equipment.warranty_alert = warranty_date <= threshold
+            equipment.days_to_warranty_end = warranty_date.toordinal() - today_ordinal
+            equipment.warranty_state = state
 
     @api.depends('request_ids', 'request_ids.cost_total', 'request_ids.duration',
                  'request_ids.close_date', 'request_ids.stage', 'request_ids.active')
     def _compute_maintenance_stats(self):
         """
         Compute maintenance statistics for equipment history.
-        Uses the One2many relationship directly to avoid N+1 queries.
+
+        All aggregates are computed by PostgreSQL in a single grouped query.
+        MTBF is the average gap between consecutive repairs, which reduces to
+        (last close date - first close date) / (number of repairs - 1).
         """
+        stats_data = self.env['maintenance.request']._read_group(
+            domain=[('equipment_id', 'in', self.ids), ('stage', '=', 'repaired')],
+            groupby=['equipment_id'],
+            aggregates=[
+                'cost_total:sum',
+                'duration:sum',
+                'close_date:max',
+                'close_date:min',
+                'close_date:count',
+            ]
+        )
+        mapped_data = {equipment.id: stats for equipment, *stats in stats_data}
         for equipment in self:
-            # Use the One2many relationship instead of search to avoid N+1 queries
-            requests = equipment.request_ids.filtered(
-                lambda r: r.active and r.stage == 'repaired'
-            )
-            equipment.total_maintenance_cost = sum(requests.mapped('cost_total'))
-            equipment.total_downtime = sum(requests.mapped('duration'))
-
-            # Get close_dates first to handle edge cases properly
-            close_dates = [r.close_date for r in requests if r.close_date]
-            if close_dates:
-                equipment.last_maintenance_date = max(close_dates)
-                # MTBF calculation (average days between repairs)
-                if len(close_dates) > 1:
-                    sorted_dates = sorted(close_dates)
-                    deltas = [(sorted_dates[i+1] - sorted_dates[i]).days
-                              for i in range(len(sorted_dates)-1)]
-                    equipment.mtbf = sum(deltas) / len(deltas) if deltas else 0
-                else:
-                    equipment.mtbf = 0
-            else:
+            stats = mapped_data.get(equipment.id)
+            if not stats:
+                equipment.total_maintenance_cost = 0.0
+                equipment.total_downtime = 0.0
                 equipment.last_maintenance_date = False
                 equipment.mtbf = 0
+                continue
+            cost_total, duration, last_close_date, first_close_date, close_count = stats
+            equipment.total_maintenance_cost = cost_total or 0.0
+            equipment.total_downtime = duration or 0.0
+            equipment.last_maintenance_date = last_close_date or False
+            # MTBF calculation (average days between repairs)
+            if close_count > 1:
+                span = (last_close_date - first_close_date).days
+                equipment.mtbf = span / (close_count - 1)
+            else:
+                equipment.mtbf = 0
 
     # ==========================================================================
-    # ONCHANGE METHODS
+    # SEARCH METHODS
     # ==========================================================================
 
-    @api.onchange('owner_type')
-    def _onchange_owner_type(self):
+    def _get_warranty_state_domains(self):
         """
-        Clear department/employee when owner_type changes.
+        Return a warranty_date domain for each warranty_state value.
+        """
+        today = self._get_today()
+        threshold = today + timedelta(days=30)
+        return {
+            'none': [('warranty_date', '=', False)],
+            'expired': [('warranty_date', '<=', today)],
+            'expiring': [('warranty_date', '>', today), ('warranty_date', '<=', threshold)],
+            'valid': [('warranty_date', '>', threshold)],
+        }
 
-        IMPLEMENTATION:
-        ---------------
-        - If owner_type = 'department': Clear employee_id
-        - If owner_type = 'employee': Clear department_id
+    def _search_warranty_alert(self, operator, value):
+        """
+        Search equipment whose warranty expires within 30 days (or not).
         """
-        if self.owner_type == 'department':
-            self.employee_id = False
-        elif self.owner_type == 'employee':
-            self.department_id = False
+        if operator not in ('=', '!='):
+            raise UserError(_("Unsupported operator %s for Warranty Alert.", operator))
+        threshold = self._get_today() + timedelta(days=30)
+        if (operator == '=') == bool(value):
+            return [('warranty_date', '!=', False), ('warranty_date', '<=', threshold)]
+        return ['|', ('warranty_date', '=', False), ('warranty_date', '>', threshold)]
+
+    def _search_warranty_state(self, operator, value):
+        """
+        Search equipment by warranty status.
+        """
+        if operator in ('=', '!='):
+            value = [value]
+        elif operator not in ('in', 'not in'):
+            raise UserError(_("Unsupported operator %s for Warranty Status.", operator))
+        state_domains = self._get_warranty_state_domains()
+        if operator in ('!=', 'not in'):
+            states = [state for state in state_domains if state not in value]
+        else:
+            states = [state for state in value if state in state_domains]
+        if not states:
+            return expression.FALSE_DOMAIN
+        return expression.OR([state_domains[state] for state in states])
+
+    def _search_days_to_warranty_end(self, operator, value):
+        """
+        Search equipment by days remaining until warranty expiration.
+
+        Equipment without a warranty date displays 0 days, so it matches
+        exactly when 0 satisfies the condition.
+        """
+        if operator not in DAYS_OPERATORS:
+            raise UserError(_("Unsupported operator %s for Days to Warranty End.", operator))
+        value = int(value)
+        domain = [('warranty_date', operator, self._get_today() + timedelta(days=value))]
+        if DAYS_OPERATORS[operator](0, value):
+            return expression.OR([domain, [('warranty_date', '=', False)]])
+        return expression.AND([domain, [('warranty_date', '!=', False)]])
+
+    # ==========================================================================
+    # ONCHANGE METHODS
+    # ==========================================================================
 
     @api.onchange('maintenance_team_id')
     def _onchange_maintenance_team_id(self):
@@ -454,6 +581,29 @@ class MaintenanceEquipment(models.Model):
         # if self.maintenance_team_id and self.maintenance_team_id.member_ids:
         #     self.technician_id = self.maintenance_team_id.member_ids[0]
 
+    # ==========================================================================
+    # CRUD OVERRIDES
+    # ==========================================================================
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        """
+        Drop the owner that does not match owner_type before creating.
+
+        Explicit values are protected from the owner computes during create,
+        so the invariant is applied to the incoming values in a single pass
+        and the whole batch is inserted at once. When owner_type is not
+        given, the default (field, context or user default) applies.
+        """
+        default_owner_type = self.default_get(['owner_type']).get('owner_type')
+        for vals in vals_list:
+            owner_type = vals.get('owner_type', default_owner_type)
+            if owner_type == 'department':
+                vals.pop('employee_id', None)
+            elif owner_type == 'employee':
+                vals.pop('department_id', None)
+        return super().create(vals_list)
+
     # ==========================================================================
     # ACTION METHODS
     # ==========================================================================
@@ -514,16 +664,16 @@ class MaintenanceEquipment(models.Model):
         ---------------
         Set state='scrapped' and active=False.
         Log a message to the chatter.
+
+        Both the write and the chatter log are done once for the whole
+        recordset rather than per equipment.
         """
-        for equipment in self:
-            equipment.write({
-                'state': 'scrapped',
-                'active': False,
-            })
-            equipment.message_post(
-                body=_("Equipment has been marked as scrapped."),
-                message_type='notification'
-            )
+        self.write({
+            'state': 'scrapped',
+            'active': False,
+        })
+        body = _("Equipment has been marked as scrapped.")
+        self._message_log_batch(bodies={equipment.id: body for equipment in self})
 
     def action_set_operational(self):
         """
@@ -534,6 +684,21 @@ class MaintenanceEquipment(models.Model):
             'active': True,
         })
 
+    # ==========================================================================
+    # HELPER METHODS
+    # ==========================================================================
+
+    @api.model
+    def _get_today(self):
+        """
+        Today's date, memoized for the current transaction.
+
+        Relies on the cursor's cached transaction timestamp so every
+        compute batch and search within one request uses the same date
+        without recomputing it.
+        """
+        return self.env.cr.now().date()
+
     # ==========================================================================
     # CONSTRAINTS
     # ==========================================================================
@@ -554,8 +719,22 @@ class MaintenanceEquipment(models.Model):
                     _("Please select an Employee when Owner Type is 'Employee'.")
                 )
 
+    @api.constrains('technician_id', 'maintenance_team_id')
+    def _check_technician_in_team(self):
+        """
+        Validate that the default technician belongs to the maintenance team.
+        """
+        for equipment in self:
+            if (equipment.technician_id and
+                    equipment.technician_id not in equipment.maintenance_team_id.member_ids):
+                raise ValidationError(
+                    _("The technician must be a member of the selected Maintenance Team.")
+                )
+
     _sql_constraints = [
-        ('serial_unique', 'UNIQUE(serial_number, company_id)',
+        ('serial_unique',
+         'EXCLUDE (serial_number WITH =, company_id WITH =) '
+         'WHERE (active AND serial_number IS NOT NULL)',
          'Serial number must be unique per company!'),
     ]
 
@@ -563,16 +742,15 @@ class MaintenanceEquipment(models.Model):
     # DISPLAY NAME
     # ==========================================================================
 
-    def name_get(self):
+    @api.depends('name', 'serial_number')
+    def _compute_display_name(self):
         """
         Display name with serial number if available.
 
         Example: "CNC Machine #001 [SN-12345]"
         """
-        result = []
         for equipment in self:
-            name = equipment.name
             if equipment.serial_number:
-                name = f"{name} [{equipment.serial_number}]"
-            result.append((equipment.id, name))
-        return result
+                equipment.display_name = f"{equipment.name or ''} [{equipment.serial_number}]"
+            else:
+                equipment.display_name = equipment.name
@@ -90,7 +90,7 @@ class MaintenanceEquipmentCategory(models.Model):
     equipment_count = fields.Integer(
         string='Equipment Count',
         compute='_compute_equipment_count',
-        store=False,
+        store=True,
         help="Number of equipment items in this category"
     )
 
@@ -98,17 +98,19 @@ class MaintenanceEquipmentCategory(models.Model):
     # COMPUTE METHODS
     # ==========================================================================
 
-    @api.depends('equipment_ids')
+    @api.depends('equipment_ids', 'equipment_ids.active')
     def _compute_equipment_count(self):
         """
         Compute the number of equipment in each category.
+        Stored, so it is only recomputed for the categories whose
+        equipment changed instead of on every list/kanban load.
         """
-        equipment_data = self.env['maintenance.equipment'].read_group(
+        equipment_data = self.env['maintenance.equipment']._read_group(
             domain=[('category_id', 'in', self.ids), ('active', '=', True)],
-            fields=['category_id'],
-            groupby=['category_id']
+            groupby=['category_id'],
+            aggregates=['__count']
         )
-        mapped_data = {x['category_id'][0]: x['category_id_count'] for x in equipment_data}
+        mapped_data = {category.id: count for category, count in equipment_data}
         for category in self:
             category.equipment_count = mapped_data.get(category.id, 0)
 
@@ -142,8 +142,8 @@ DEMO DATA NEEDED:
 """
 
 from datetime import timedelta
-from odoo import models, fields, api, _
-from odoo.exceptions import UserError, ValidationError
+from odoo import models, fields, api, tools, _
+from odoo.exceptions import UserError
 
 
 class MaintenanceRequest(models.Model):
@@ -164,6 +164,9 @@ class MaintenanceRequest(models.Model):
         ('scrap', 'Scrap'),
     ]
 
+    # Stage keys in display order (used by _expand_stages)
+    STAGE_KEYS = tuple(key for key, val in STAGE_SELECTION)
+
     PRIORITY_SELECTION = [
         ('0', 'Low'),
         ('1', 'Normal'),
@@ -261,7 +264,7 @@ class MaintenanceRequest(models.Model):
 
     request_date = fields.Date(
         string='Request Date',
-        default=fields.Date.today,
+        default=fields.Date.context_today,
         required=True,
         tracking=True,
         help="Date when the request was created"
@@ -269,6 +272,7 @@ class MaintenanceRequest(models.Model):
 
     schedule_date = fields.Date(
         string='Scheduled Date',
+        index=True,
         tracking=True,
         help="Date when the maintenance should be performed. "
              "Used for calendar view and overdue calculation."
@@ -289,6 +293,7 @@ class MaintenanceRequest(models.Model):
         comodel_name='maintenance.equipment',
         string='Equipment',
         required=True,
+        index=True,
         tracking=True,
         help="Equipment that requires maintenance. "
              "Selecting equipment will auto-fill team and technician."
@@ -312,15 +317,14 @@ class MaintenanceRequest(models.Model):
         comodel_name='res.users',
         string='Technician',
         tracking=True,
-        domain="[('id', 'in', team_member_ids)]",
+        domain="technician_domain",
         help="Technician assigned to this request"
     )
 
-    # Helper field for technician domain
-    team_member_ids = fields.Many2many(
-        comodel_name='res.users',
-        related='maintenance_team_id.member_ids',
-        string='Team Members',
+    # Helper field for technician domain, resolved once when the form loads
+    technician_domain = fields.Binary(
+        string='Technician Domain',
+        compute='_compute_technician_domain',
     )
 
     # ==========================================================================
@@ -407,6 +411,16 @@ class MaintenanceRequest(models.Model):
             request.cost_labor = request.duration * request.cost_labor_rate
             request.cost_total = request.cost_parts + request.cost_labor
 
+    @api.depends('maintenance_team_id', 'maintenance_team_id.member_ids')
+    def _compute_technician_domain(self):
+        """
+        Restrict selectable technicians to the members of the maintenance team.
+        """
+        for request in self:
+            request.technician_domain = [
+                ('id', 'in', request.maintenance_team_id.member_ids.ids)
+            ]
+
     @api.depends('schedule_date', 'stage')
     def _compute_overdue(self):
         """
@@ -424,15 +438,17 @@ class MaintenanceRequest(models.Model):
         - In Tree: Show red row or icon
         """
         today = fields.Date.today()
+        # Integer ordinals avoid allocating a timedelta per record
+        today_ordinal = today.toordinal()
         for request in self:
-            if (request.schedule_date and
-                    request.schedule_date < today and
+            schedule_date = request.schedule_date
+            if (schedule_date and schedule_date < today and
                     request.stage not in ('repaired', 'scrap')):
-                request.is_overdue = True
-                request.days_overdue = (today - request.schedule_date).days
+                days_overdue = today_ordinal - schedule_date.toordinal()
             else:
-                request.is_overdue = False
-                request.days_overdue = 0
+                days_overdue = 0
+            request.is_overdue = bool(days_overdue)
+            request.days_overdue = days_overdue
 
     # ==========================================================================
     # ONCHANGE METHODS - AUTO-FILL LOGIC
@@ -488,7 +504,10 @@ class MaintenanceRequest(models.Model):
         SCRAP LOGIC - CRITICAL DEMO FEATURE
         =====================================================================
 
-        Override write to handle stage transitions:
+        Override write to handle stage transitions. The handlers for the
+        target stage are looked up in _STAGE_HANDLERS (before saving) and
+        _STAGE_POST_HANDLERS (after saving), so writes that don't touch the
+        stage skip all transition logic:
 
         1. SCRAP LOGIC:
            When stage changes to 'scrap':
@@ -496,7 +515,7 @@ class MaintenanceRequest(models.Model):
            - Set equipment.state = 'scrapped'
            - Post message to equipment chatter
 
-        2. AUTO-ASSIGN ON IN_PROGRESS:
+        2. AUTO-ASSIGN ON IN_PROGRESS (after the stage write):
            When stage changes to 'in_progress':
            - If technician_id is empty, assign current user
 
@@ -511,47 +530,83 @@ class MaintenanceRequest(models.Model):
         [Drag card to Scrap column]
         "The equipment is now automatically marked as unusable!"
         """
-        # Handle stage transitions
-        if 'stage' in vals:
-            new_stage = vals['stage']
-
-            # SCRAP LOGIC
-            if new_stage == 'scrap':
-                for request in self:
-                    if request.equipment_id:
-                        # Deactivate equipment
-                        request.equipment_id.sudo().write({
-                            'active': False,
-                            'state': 'scrapped',
-                        })
-                        # Log message to equipment
-                        request.equipment_id.message_post(
-                            body=_(
-                                "Equipment scrapped due to maintenance request: "
-                                "<a href='#' data-oe-model='maintenance.request' "
-                                "data-oe-id='%d'>%s</a>"
-                            ) % (request.id, request.name),
-                            message_type='notification',
-                        )
-
-            # SET CLOSE_DATE ON REPAIRED
-            if new_stage == 'repaired':
-                if 'close_date' not in vals:
-                    vals['close_date'] = fields.Date.today()
-
+        stage = vals.get('stage')
+        handler = self._STAGE_HANDLERS.get(stage)
+        if handler:
+            getattr(self, handler)(vals)
         result = super().write(vals)
+        post_handler = self._STAGE_POST_HANDLERS.get(stage)
+        if post_handler:
+            getattr(self, post_handler)(vals)
+        return result
 
-        # AUTO-ASSIGN ON IN_PROGRESS (done after write to handle per-record assignment)
-        if 'stage' in vals and vals['stage'] == 'in_progress':
-            for request in self:
-                if not request.technician_id:
-                    # Prefer first team member, fallback to current user
-                    if request.maintenance_team_id and request.maintenance_team_id.member_ids:
-                        request.technician_id = request.maintenance_team_id.member_ids[0]
-                    else:
-                        request.technician_id = self.env.user
+    # Stage transition handlers, dispatched by write() before saving.
+    # Each receives the vals dict and may complete it in place.
+    _STAGE_HANDLERS = {
+        'scrap': '_handle_stage_scrap',
+        'repaired': '_handle_stage_repaired',
+    }
+
+    # Stage transition handlers, dispatched by write() after saving.
+    # Auto-assignment must run after the stage write: record rules check
+    # write access on the request as it was before the write, and a
+    # technician may only write unassigned requests or their own.
+    _STAGE_POST_HANDLERS = {
+        'in_progress': '_handle_stage_in_progress',
+    }
+
+    def _handle_stage_scrap(self, vals):
+        """
+        SCRAP LOGIC: deactivate the equipment and log it on its chatter.
+        """
+        equipments = self.mapped('equipment_id')
+        if not equipments:
+            return
+        # Deactivate all affected equipment in a single write, skipping
+        # those that are already scrapped. Field tracking is disabled: the
+        # chatter message below already records the change.
+        equipments.filtered(
+            lambda e: e.active or e.state != 'scrapped'
+        ).sudo().with_context(mail_notrack=True).write({
+            'active': False,
+            'state': 'scrapped',
+        })
+        # Log one message per equipment, listing its requests. The templates
+        # are built once so translation lookups don't repeat per equipment.
+        body_tpl = _("Equipment scrapped due to maintenance request: %s")
+        link_tpl = ("<a href='#' data-oe-model='maintenance.request' "
+                    "data-oe-id='%(id)d'>%(name)s</a>")
+        for equipment, requests in self.filtered('equipment_id').grouped('equipment_id').items():
+            links = ", ".join(
+                link_tpl % {'id': request.id, 'name': request.name}
+                for request in requests
+            )
+            equipment.message_post(
+                body=body_tpl % links,
+                message_type='notification',
+            )
+
+    def _handle_stage_in_progress(self, vals):
+        """
+        AUTO-ASSIGN: give unassigned requests a technician.
+        """
+        if vals.get('technician_id'):
+            return
+        unassigned = self.filtered(lambda r: not r.technician_id)
+        # Prefer first team member, fallback to current user; one write
+        # per technician
+        by_technician = unassigned.grouped(
+            lambda r: r.maintenance_team_id.member_ids[:1] or self.env.user
+        )
+        for technician, requests in by_technician.items():
+            requests.technician_id = technician
 
-        return result
+    def _handle_stage_repaired(self, vals):
+        """
+        SET CLOSE_DATE ON REPAIRED: default the close date to today.
+        """
+        if 'close_date' not in vals:
+            vals['close_date'] = fields.Date.context_today(self)
 
     @api.model
     def create(self, vals):
@@ -560,7 +615,7 @@ class MaintenanceRequest(models.Model):
         """
         if vals.get('maintenance_type') == 'preventive' and not vals.get('schedule_date'):
             # Default to one week from now for preventive
-            vals['schedule_date'] = fields.Date.today() + timedelta(days=7)
+            vals['schedule_date'] = fields.Date.context_today(self) + timedelta(days=7)
         return super().create(vals)
 
     # ==========================================================================
@@ -572,9 +627,7 @@ class MaintenanceRequest(models.Model):
         Button action to move request from 'new' to 'in_progress'.
         Technician auto-assignment is handled by write() method.
         """
-        for request in self:
-            if request.stage == 'new':
-                request.write({'stage': 'in_progress'})
+        self.filtered(lambda r: r.stage == 'new').write({'stage': 'in_progress'})
 
     def action_complete_maintenance(self):
         """
@@ -583,16 +636,15 @@ class MaintenanceRequest(models.Model):
         VALIDATION:
         - Duration must be > 0 to complete maintenance
         """
-        for request in self:
-            if request.stage == 'in_progress':
-                if not request.duration:
-                    raise UserError(
-                        _("Please enter the duration (hours) before completing maintenance.")
-                    )
-                request.write({
-                    'stage': 'repaired',
-                    'close_date': fields.Date.today(),
-                })
+        to_complete = self.filtered(lambda r: r.stage == 'in_progress')
+        if any(not request.duration for request in to_complete):
+            raise UserError(
+                _("Please enter the duration (hours) before completing maintenance.")
+            )
+        to_complete.write({
+            'stage': 'repaired',
+            'close_date': fields.Date.context_today(self),
+        })
 
     def action_scrap_equipment(self):
         """
@@ -621,7 +673,7 @@ class MaintenanceRequest(models.Model):
 
         This is required for proper Kanban drag-and-drop functionality.
         """
-        return [key for key, val in self.STAGE_SELECTION]
+        return list(self.STAGE_KEYS)
 
     @api.model
     def _get_default_labor_rate(self):
@@ -638,15 +690,20 @@ class MaintenanceRequest(models.Model):
         except (ValueError, TypeError):
             return 50.0
 
+    def _get_overdue_domain(self):
+        """
+        Domain matching overdue requests.
+        """
+        return [
+            ('schedule_date', '<', fields.Date.today()),
+            ('stage', 'in', ('new', 'in_progress')),
+        ]
+
     def _get_overdue_requests(self):
         """
         Get all overdue requests (for scheduled actions/reports).
         """
-        today = fields.Date.today()
-        return self.search([
-            ('schedule_date', '<', today),
-            ('stage', 'not in', ('repaired', 'scrap')),
-        ])
+        return self.search(self._get_overdue_domain())
 
     # ==========================================================================
     # SCHEDULED ACTIONS (called by cron)
@@ -659,47 +716,85 @@ class MaintenanceRequest(models.Model):
 
         IMPLEMENTATION:
         ---------------
-        1. Find all overdue requests
-        2. Group by technician
-        3. Send email notification to each technician
+        Send the overdue template for all overdue requests in one batch.
+        The template renders one request per email.
+
+        Requests without a technician are skipped: the template is
+        addressed to the technician's email.
 
         Configure in data/scheduled_actions.xml
         """
-        overdue_requests = self._get_overdue_requests()
-        # TODO: Group by technician and send emails
-        # Use mail.template from data/mail_templates.xml
+        template = self.env.ref('gearguard.mail_template_request_overdue', raise_if_not_found=False)
+        if not template:
+            return True
+        requests = self.search(self._get_overdue_domain() + [('technician_id', '!=', False)])
+        template.send_mail_batch(requests.ids)
         return True
 
     # ==========================================================================
-    # CONSTRAINTS
+    # DATABASE INDEXES
     # ==========================================================================
 
-    @api.constrains('schedule_date', 'close_date')
-    def _check_dates(self):
+    def init(self):
         """
-        Validate that close_date is not before schedule_date.
+        Create partial indexes serving the open-request aggregates.
+
+        Open request counts per team and overdue lookups exclude closed
+        stages; the partial indexes only hold open rows, so the planner
+        can answer those queries without a sequential scan. Each query
+        repeats its index predicate verbatim: the ORM renders
+        ('stage', 'not in', ...) with an extra "OR stage IS NULL", which
+        does not imply a NOT IN index predicate, hence the positive IN
+        list for overdue lookups. The reporting indexes back the maintenance
+        report views, which only read active requests.
         """
-        for request in self:
-            if request.schedule_date and request.close_date:
-                if request.close_date < request.schedule_date:
-                    raise ValidationError(_(
-                        "Close date cannot be before scheduled date."
-                    ))
+        tools.create_index(
+            self.env.cr, 'maintenance_request_overdue_idx',
+            self._table, ['schedule_date'],
+            where="stage IN ('new', 'in_progress')"
+        )
+        # Team dashboard counts (open / new requests per team); the team
+        # count query repeats this predicate so the planner can use it
+        tools.create_index(
+            self.env.cr, 'maintenance_request_team_stage_open_idx',
+            self._table, ['maintenance_team_id'],
+            where="stage NOT IN ('repaired', 'scrap')"
+        )
+        # Reporting: team and date filters/sort on active requests (all stages)
+        tools.create_index(
+            self.env.cr, 'maintenance_request_team_active_idx',
+            self._table, ['maintenance_team_id'],
+            where="active"
+        )
+        tools.create_index(
+            self.env.cr, 'maintenance_request_request_date_active_idx',
+            self._table, ['request_date DESC'],
+            where="active"
+        )
+
+    # ==========================================================================
+    # CONSTRAINTS
+    # ==========================================================================
+
+    _sql_constraints = [
+        ('close_after_schedule',
+         'CHECK (close_date IS NULL OR schedule_date IS NULL OR close_date >= schedule_date)',
+         'Close date cannot be before scheduled date.'),
+    ]
 
     # ==========================================================================
     # DISPLAY NAME
     # ==========================================================================
 
-    def name_get(self):
+    @api.depends('name', 'equipment_id.name')
+    def _compute_display_name(self):
         """
         Display name with equipment name.
 
         Example: "Oil Leak - CNC Machine #001"
         """
-        result = []
         for request in self:
-            name = request.name
             if request.equipment_id:
-                name = f"{name} - {request.equipment_id.name}"
-            result.append((request.id, name))
-        return result
+                request.display_name = f"{request.name or ''} - {request.equipment_id.name or ''}"
+            else:
+                request.display_name = request.name
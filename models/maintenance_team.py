@@ -131,14 +131,16 @@ class MaintenanceTeam(models.Model):
     open_request_count = fields.Integer(
         string='Open Requests',
         compute='_compute_request_counts',
-        store=False,
+        store=True,
+        compute_sudo=True,
         help="Number of open maintenance requests (not repaired/scrapped)"
     )
 
     todo_request_count = fields.Integer(
         string='New Requests',
         compute='_compute_request_counts',
-        store=False,
+        store=True,
+        compute_sudo=True,
         help="Number of requests in 'New' stage waiting to be picked up"
     )
 
@@ -153,33 +155,60 @@ class MaintenanceTeam(models.Model):
     # COMPUTE METHODS
     # ==========================================================================
 
-    @api.depends('request_ids', 'request_ids.stage')
+    @api.depends('request_ids', 'request_ids.stage', 'request_ids.active')
     def _compute_request_counts(self):
         """
         Compute open request count and todo (new) request count.
+
+        Both counts come from one scan of the team's open requests (the
+        'new' count is a conditional aggregate, COUNT ... FILTER), instead
+        of one GROUP BY per count. The stage predicate matches the
+        maintenance_request_team_stage_open_idx partial index. Counts are
+        team-wide totals, stored and only refreshed when a request of the
+        team changes.
         """
+        self.env['maintenance.request'].flush_model(['maintenance_team_id', 'stage', 'active'])
+        self.env.cr.execute("""
+            SELECT maintenance_team_id,
+                   COUNT(*),
+                   COUNT(*) FILTER (WHERE stage = 'new')
+              FROM maintenance_request
+             WHERE maintenance_team_id = ANY(%s)
+               AND active
+               AND stage NOT IN ('repaired', 'scrap')
+          GROUP BY maintenance_team_id
+        """, [list(self.ids)])
+        counts = {team_id: (open_count, new_count)
+                  for team_id, open_count, new_count in self.env.cr.fetchall()}
         for team in self:
-            requests = self.env['maintenance.request'].search([
-                ('maintenance_team_id', '=', team.id),
-                ('active', '=', True)
-            ])
-            team.open_request_count = len(requests.filtered(
-                lambda r: r.stage not in ('repaired', 'scrap')
-            ))
-            team.todo_request_count = len(requests.filtered(
-                lambda r: r.stage == 'new'
-            ))
+            team.open_request_count, team.todo_request_count = counts.get(team.id, (0, 0))
 
     @api.depends('equipment_ids')
     def _compute_equipment_count(self):
         """
         Compute the number of equipment assigned to this team.
+
+        A single team (form view smart button) is answered with a plain
+        COUNT(*); larger recordsets use one grouped query.
         """
+        if len(self) == 1 and self.id:
+            self.env['maintenance.equipment'].flush_model(['maintenance_team_id', 'active'])
+            self.env.cr.execute("""
+                SELECT COUNT(*)
+                  FROM maintenance_equipment
+                 WHERE maintenance_team_id = %s
+                   AND active
+            """, [self.id])
+            self.equipment_count = self.env.cr.fetchone()[0]
+            return
+        equipment_data = self.env['maintenance.equipment']._read_group(
+            domain=[('maintenance_team_id', 'in', self.ids), ('active', '=', True)],
+            groupby=['maintenance_team_id'],
+            aggregates=['__count']
+        )
+        mapped_data = {team.id: count for team, count in equipment_data}
         for team in self:
-            team.equipment_count = self.env['maintenance.equipment'].search_count([
-                ('maintenance_team_id', '=', team.id),
-                ('active', '=', True)
-            ])
+            team.equipment_count = mapped_data.get(team.id, 0)
 
     # ==========================================================================
     # ACTION METHODS
@@ -188,6 +217,10 @@ class MaintenanceTeam(models.Model):
     def action_view_requests(self):
         """
         Smart button action to view all requests for this team.
+
+        Opens on the team's open requests (New + In Progress filters),
+        matching the count shown on the button; the filters are applied
+        in the SQL search and can be removed to see closed requests.
         """
         self.ensure_one()
         return {
@@ -196,7 +229,11 @@ class MaintenanceTeam(models.Model):
             'res_model': 'maintenance.request',
             'view_mode': 'kanban,tree,form,calendar',
             'domain': [('maintenance_team_id', '=', self.id)],
-            'context': {'default_maintenance_team_id': self.id},
+            'context': {
+                'default_maintenance_team_id': self.id,
+                'search_default_new': 1,
+                'search_default_in_progress': 1,
+            },
         }
 
     def action_view_equipment(self):
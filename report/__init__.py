@@ -1,3 +1,4 @@
 # -*- coding: utf-8 -*-
 
 from . import maintenance_report
+from . import maintenance_report_summary
@@ -45,12 +45,16 @@ FIELDS:
 | duration          | Float     | Hours spent                        |
 | cost_total        | Float     | Total cost                         |
 | resolution_days   | Integer   | Days to resolve                    |
+| corrective_flag   | Integer   | 1 for corrective requests          |
+| preventive_flag   | Integer   | 1 for preventive requests          |
 
 VIEWS NEEDED:
 - Pivot view for multidimensional analysis
 - Graph view for visualizations
 """
 
+from psycopg2 import sql
+
 from odoo import models, fields, api, tools
 
 
@@ -176,6 +180,18 @@ class MaintenanceReport(models.Model):
         group_operator='sum'
     )
 
+    corrective_flag = fields.Integer(
+        string='# Corrective',
+        readonly=True,
+        group_operator='sum'
+    )
+
+    preventive_flag = fields.Integer(
+        string='# Preventive',
+        readonly=True,
+        group_operator='sum'
+    )
+
     company_id = fields.Many2one(
         comodel_name='res.company',
         string='Company',
@@ -200,8 +216,8 @@ class MaintenanceReport(models.Model):
         """
         tools.drop_view_if_exists(self.env.cr, self._table)
 
-        self.env.cr.execute("""
-            CREATE OR REPLACE VIEW %s AS (
+        self.env.cr.execute(sql.SQL("""
+            CREATE OR REPLACE VIEW {} AS (
                 SELECT
                     r.id AS id,
                     r.name AS name,
@@ -225,6 +241,8 @@ class MaintenanceReport(models.Model):
                         ELSE NULL
                     END AS resolution_days,
                     1 AS request_count,
+                    CASE WHEN r.maintenance_type = 'corrective' THEN 1 ELSE 0 END AS corrective_flag,
+                    CASE WHEN r.maintenance_type = 'preventive' THEN 1 ELSE 0 END AS preventive_flag,
                     r.company_id AS company_id
                 FROM
                     maintenance_request r
@@ -233,7 +251,7 @@ class MaintenanceReport(models.Model):
                 WHERE
                     r.active = TRUE
             )
-        """ % self._table)
+        """).format(sql.Identifier(self._table)))
 
     # ==========================================================================
     # Additional methods for custom reporting can be added here
@@ -253,16 +271,18 @@ class MaintenanceReport(models.Model):
         - preventive_count
         """
         domain = domain or []
-        requests = self.search(domain)
+        [(total_requests, total_duration, total_cost, avg_resolution,
+          corrective_count, preventive_count)] = self._read_group(
+            domain, [],
+            ['request_count:sum', 'duration:sum', 'cost_total:sum', 'resolution_days:avg',
+             'corrective_flag:sum', 'preventive_flag:sum'],
+        )
 
         return {
-            'total_requests': len(requests),
-            'total_duration': sum(requests.mapped('duration')),
-            'total_cost': sum(requests.mapped('cost_total')),
-            'avg_resolution_time': (
-                sum(r.resolution_days or 0 for r in requests) / len(requests)
-                if requests else 0
-            ),
-            'corrective_count': len(requests.filtered(lambda r: r.maintenance_type == 'corrective')),
-            'preventive_count': len(requests.filtered(lambda r: r.maintenance_type == 'preventive')),
+            'total_requests': total_requests or 0,
+            'total_duration': total_duration or 0.0,
+            'total_cost': total_cost or 0.0,
+            'avg_resolution_time': avg_resolution or 0,
+            'corrective_count': corrective_count or 0,
+            'preventive_count': preventive_count or 0,
         }
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Maintenance Report Summary Model (Materialized View)
+====================================================
+
+Pre-aggregated companion of maintenance.report for dashboards.
+
+PURPOSE:
+--------
+- Serve pivot and graph views without re-aggregating every request row
+- Keep maintenance.report (one row per request) for drill-downs
+
+The data is grouped by team, category, type, stage and month in a
+MATERIALIZED VIEW, so dashboard queries read a few hundred rows instead
+of scanning maintenance_request. It is refreshed nightly by the
+"Maintenance: Refresh Report Summary" scheduled action and shown under
+Reporting > Maintenance Summary.
+
+Resolution time is stored as a total and a count of closed requests,
+both summed, so the rollup over any grouping stays exact (an average of
+per-row averages would not be).
+
+FIELDS:
+-------
+| Field Name          | Type      | Description                        |
+|---------------------|-----------|------------------------------------|
+| maintenance_team_id | Many2one  | Maintenance team                   |
+| category_id         | Many2one  | Equipment category                 |
+| maintenance_type    | Selection | Corrective/Preventive              |
+| stage               | Selection | Request stage                      |
+| request_month       | Date      | First day of the request month     |
+| duration            | Float     | Hours spent                        |
+| cost_total          | Float     | Total cost                         |
+| resolution_days     | Integer   | Total days to resolve (closed)     |
+| closed_count        | Integer   | Number of closed requests          |
+| request_count       | Integer   | Number of requests                 |
+"""
+
+from psycopg2 import sql
+
+from odoo import models, fields, api, tools
+
+
+class MaintenanceReportSummary(models.Model):
+    _name = 'maintenance.report.summary'
+    _description = 'Maintenance Analysis Summary'
+    _auto = False  # This is a MATERIALIZED VIEW, not a table
+    _order = 'request_month desc'
+
+    # ==========================================================================
+    # FIELDS (Read-only, mapped from the materialized view)
+    # ==========================================================================
+
+    maintenance_team_id = fields.Many2one(
+        comodel_name='maintenance.team',
+        string='Team',
+        readonly=True
+    )
+
+    category_id = fields.Many2one(
+        comodel_name='maintenance.equipment.category',
+        string='Category',
+        readonly=True
+    )
+
+    maintenance_type = fields.Selection(
+        selection=[
+            ('corrective', 'Corrective'),
+            ('preventive', 'Preventive'),
+        ],
+        string='Type',
+        readonly=True
+    )
+
+    stage = fields.Selection(
+        selection=[
+            ('new', 'New'),
+            ('in_progress', 'In Progress'),
+            ('repaired', 'Repaired'),
+            ('scrap', 'Scrap'),
+        ],
+        string='Stage',
+        readonly=True
+    )
+
+    request_month = fields.Date(
+        string='Month',
+        readonly=True
+    )
+
+    duration = fields.Float(
+        string='Duration (Hours)',
+        readonly=True,
+        group_operator='sum'
+    )
+
+    cost_total = fields.Float(
+        string='Total Cost',
+        readonly=True,
+        group_operator='sum'
+    )
+
+    resolution_days = fields.Integer(
+        string='Resolution Days (Total)',
+        readonly=True,
+        group_operator='sum',
+        help="Sum of days between request date and close date of the closed requests"
+    )
+
+    closed_count = fields.Integer(
+        string='# Closed Requests',
+        readonly=True,
+        group_operator='sum',
+        help="Number of closed requests, to average the resolution days"
+    )
+
+    request_count = fields.Integer(
+        string='# Requests',
+        readonly=True,
+        group_operator='sum'
+    )
+
+    company_id = fields.Many2one(
+        comodel_name='res.company',
+        string='Company',
+        readonly=True
+    )
+
+    # ==========================================================================
+    # SQL VIEW DEFINITION
+    # ==========================================================================
+
+    def init(self):
+        """
+        Create the materialized view and the unique index required to
+        refresh it concurrently (without locking out readers).
+        """
+        tools.drop_view_if_exists(self.env.cr, self._table)
+
+        self.env.cr.execute(sql.SQL("""
+            CREATE MATERIALIZED VIEW {} AS (
+                SELECT
+                    row_number() OVER (
+                        ORDER BY s.request_month, s.maintenance_team_id, s.category_id,
+                                 s.maintenance_type, s.stage, s.company_id
+                    ) AS id,
+                    s.*
+                FROM (
+                    SELECT
+                        r.maintenance_team_id AS maintenance_team_id,
+                        e.category_id AS category_id,
+                        r.maintenance_type AS maintenance_type,
+                        r.stage AS stage,
+                        date_trunc('month', r.request_date)::DATE AS request_month,
+                        r.company_id AS company_id,
+                        SUM(r.duration) AS duration,
+                        SUM(r.cost_total) AS cost_total,
+                        SUM(r.close_date - r.request_date) AS resolution_days,
+                        COUNT(*) FILTER (
+                            WHERE r.close_date IS NOT NULL AND r.request_date IS NOT NULL
+                        ) AS closed_count,
+                        COUNT(*) AS request_count
+                    FROM
+                        maintenance_request r
+                    LEFT JOIN
+                        maintenance_equipment e ON r.equipment_id = e.id
+                    WHERE
+                        r.active = TRUE
+                    GROUP BY 1, 2, 3, 4, 5, 6
+                ) s
+            )
+        """).format(sql.Identifier(self._table)))
+        self.env.cr.execute(sql.SQL("CREATE UNIQUE INDEX {} ON {} (id)").format(
+            sql.Identifier('%s_id_idx' % self._table),
+            sql.Identifier(self._table),
+        ))
+
+    # ==========================================================================
+    # SCHEDULED ACTIONS (called by cron)
+    # ==========================================================================
+
+    @api.model
+    def _cron_refresh_summary(self):
+        """
+        Scheduled action: Refresh the materialized view.
+
+        Configure in data/scheduled_actions.xml
+        """
+        self.env['maintenance.request'].flush_model()
+        self.env.cr.execute(
+            sql.SQL("REFRESH MATERIALIZED VIEW CONCURRENTLY {}").format(sql.Identifier(self._table))
+        )
+        return True
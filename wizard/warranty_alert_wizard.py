@@ -92,9 +92,11 @@ class WarrantyAlertWizard(models.TransientModel):
         res = super().default_get(fields_list)
         if 'equipment_ids' in fields_list:
             active_ids = self.env.context.get('active_ids', [])
-            equipment = self.env['maintenance.equipment'].browse(active_ids)
-            # Filter to only those with warranty alerts
-            equipment_with_alert = equipment.filtered(lambda e: e.warranty_alert)
+            # Filter to only those with warranty alerts (done in SQL)
+            equipment_with_alert = self.env['maintenance.equipment'].search([
+                ('id', 'in', active_ids),
+                ('warranty_alert', '=', True),
+            ])
             res['equipment_ids'] = [(6, 0, equipment_with_alert.ids)]
         return res
         ```
@@ -105,16 +107,35 @@ class WarrantyAlertWizard(models.TransientModel):
         if 'equipment_ids' in fields_list:
             active_ids = self.env.context.get('active_ids', [])
             if active_ids:
-                res['equipment_ids'] = [(6, 0, active_ids)]
+                # Keep only equipment with a warranty alert; the filter is
+                # translated to a warranty_date domain and runs in SQL
+                equipment = self.env['maintenance.equipment'].search([
+                    ('id', 'in', active_ids),
+                    ('warranty_alert', '=', True),
+                ])
+                res['equipment_ids'] = [(6, 0, equipment.ids)]
 
         # Set default template
         if 'template_id' in fields_list:
-            template = self.env.ref('gearguard.mail_template_warranty_alert', raise_if_not_found=False)
-            if template:
-                res['template_id'] = template.id
+            template_id = self._default_template_id()
+            if template_id:
+                res['template_id'] = template_id
 
         return res
 
+    @api.model
+    def _default_template_id(self):
+        """
+        Database id of the default warranty alert template, or False.
+
+        Resolved through the xmlid lookup, which is served from the
+        registry's ormcache, without browsing the template or checking
+        that it exists on every wizard open.
+        """
+        return self.env['ir.model.data']._xmlid_to_res_id(
+            'gearguard.mail_template_warranty_alert', raise_if_not_found=False
+        )
+
     # ==========================================================================
     # COMPUTE METHODS
     # ==========================================================================
@@ -127,21 +148,27 @@ class WarrantyAlertWizard(models.TransientModel):
         IMPLEMENTATION:
         ---------------
         Use the first equipment record to render template preview.
+        Wizards sharing a template are rendered with a single
+        _render_field call, which batches the record reads.
         """
-        for wizard in self:
-            if wizard.equipment_ids and wizard.template_id:
-                # Render template for first equipment
-                first_equipment = wizard.equipment_ids[0]
-                try:
-                    wizard.email_preview = wizard.template_id._render_field(
-                        'body_html',
-                        [first_equipment.id],
-                        compute_lang=True
-                    )[first_equipment.id]
-                except Exception:
-                    wizard.email_preview = '<p>Unable to generate preview</p>'
-            else:
-                wizard.email_preview = '<p>Select equipment and template to see preview</p>'
+        self.email_preview = '<p>Select equipment and template to see preview</p>'
+        wizards = self.filtered(lambda w: w.equipment_ids and w.template_id)
+        for template, template_wizards in wizards.grouped('template_id').items():
+            first_ids = {
+                wizard: wizard.equipment_ids[:1]._origin.id
+                for wizard in template_wizards
+            }
+            try:
+                bodies = template._render_field(
+                    'body_html',
+                    list(set(first_ids.values())),
+                    compute_lang=True
+                )
+            except Exception:
+                template_wizards.email_preview = '<p>Unable to generate preview</p>'
+                continue
+            for wizard, equipment_id in first_ids.items():
+                wizard.email_preview = bodies[equipment_id]
 
     # ==========================================================================
     # ACTION METHODS
@@ -154,9 +181,8 @@ class WarrantyAlertWizard(models.TransientModel):
         IMPLEMENTATION:
         ---------------
         1. Validate equipment selection
-        2. Loop through equipment
-        3. Send email using template
-        4. Log activity/message
+        2. Queue the emails for all equipment in one batch
+        3. Log a chatter message on each equipment in one batch
 
         Example:
         ```python
@@ -167,19 +193,19 @@ class WarrantyAlertWizard(models.TransientModel):
         if not self.template_id:
             raise UserError(_("Please select an email template."))
 
-        for equipment in self.equipment_ids:
-            self.template_id.send_mail(equipment.id, force_send=True)
-            equipment.message_post(
-                body=_("Warranty alert sent."),
-                message_type='notification'
-            )
+        # Queue all emails in one batch and log them in one call
+        self.template_id.send_mail_batch(self.equipment_ids.ids)
+        body = _("Warranty alert sent.")
+        self.equipment_ids._message_log_batch(
+            bodies={equipment.id: body for equipment in self.equipment_ids}
+        )
 
         return {
             'type': 'ir.actions.client',
             'tag': 'display_notification',
             'params': {
                 'title': _("Alerts Sent"),
-                'message': _("%d warranty alerts have been sent.") % len(self.equipment_ids),
+                'message': _("%d warranty alerts have been processed.") % len(self.equipment_ids),
                 'type': 'success',
                 'sticky': False,
             }
@@ -194,14 +220,13 @@ class WarrantyAlertWizard(models.TransientModel):
         if not self.template_id:
             raise UserError(_("Please select an email template."))
 
-        # Send warranty alert emails
-        if self.template_id:
-            for equipment in self.equipment_ids:
-                self.template_id.send_mail(equipment.id, force_send=True)
-                equipment.message_post(
-                    body=_("Warranty alert sent."),
-                    message_type='notification'
-                )
+        # Render and queue all alert emails in one batch; they are sent by
+        # the mail queue cron instead of one synchronous SMTP call each
+        self.template_id.send_mail_batch(self.equipment_ids.ids)
+        body = _("Warranty alert sent.")
+        self.equipment_ids._message_log_batch(
+            bodies={equipment.id: body for equipment in self.equipment_ids}
+        )
 
         return {
             'type': 'ir.actions.client',